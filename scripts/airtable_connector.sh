@@ -40,10 +40,16 @@ setup_api() {
     echo ""
     
     if [ ! -f "$CONFIG_FILE" ]; then
-        echo "# Airtable API Configuration" > "$CONFIG_FILE"
-        echo "# Created: $TIMESTAMP" >> "$CONFIG_FILE"
-        echo "" >> "$CONFIG_FILE"
+        # Create owner-only (0600) and open it once; the file holds API tokens
+        (umask 077; {
+            echo "# Airtable API Configuration"
+            echo "# Created: $TIMESTAMP"
+            echo ""
+        } > "$CONFIG_FILE")
     fi
+    # Tighten .env files from earlier runs before the token is written;
+    # sed -i.bak then carries 0600 over to the backup as well
+    chmod 600 "$CONFIG_FILE"
     
     echo "To connect to Airtable API, you need:"
     echo "1. Go to https://airtable.com/account"
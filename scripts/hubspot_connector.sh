@@ -36,10 +36,16 @@ setup_api() {
     echo ""
     
     if [ ! -f "$CONFIG_FILE" ]; then
-        echo "# HubSpot API Configuration" > "$CONFIG_FILE"
-        echo "# Created: $TIMESTAMP" >> "$CONFIG_FILE"
-        echo "" >> "$CONFIG_FILE"
+        # Create owner-only (0600) and open it once; the file holds API tokens
+        (umask 077; {
+            echo "# HubSpot API Configuration"
+            echo "# Created: $TIMESTAMP"
+            echo ""
+        } > "$CONFIG_FILE")
     fi
+    # Tighten .env files from earlier runs before the token is written;
+    # sed -i.bak then carries 0600 over to the backup as well
+    chmod 600 "$CONFIG_FILE"
     
     echo "To connect to HubSpot API, you need:"
     echo "1. Go to HubSpot → Settings → Integrations → Private Apps"
@@ -81,7 +87,7 @@ test_connection() {
     
     # Test API call
     response=$(curl -s -w "%{http_code}" -H "Authorization: Bearer $HUBSPOT_API_TOKEN" \
-        "https://api.hubapi.com/crm/v3/objects/deals?limit=1")
+        "https://api.hubapi.com/crm/v3/objects/deals?limit=1&properties=hs_object_id")
     
     http_code="${response: -3}"
     
@@ -50,14 +50,28 @@ Syncs code changes with business knowledge repo
 
 import os
 import json
+import time
 import subprocess
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
+# File types worth scanning for business context
+WATCHED_EXTENSIONS = ('.py', '.js', '.md', '.sh')
+
+# Keywords that mark a code change as business-relevant
+BUSINESS_KEYWORDS = (
+    'hubspot', 'deal', 'pipeline', 'quote', 'revenue',
+    'customer', 'client', 'payment', 'automation'
+)
+
 class CursorBusinessSync:
     def __init__(self, repo_path):
         self.repo_path = Path(repo_path)
-        self.timestamp = datetime.utcnow().isoformat() + 'Z'
+        self.refresh_timestamp()
+        
+    def refresh_timestamp(self):
+        """Stamp the current UTC time, shared by everything one change writes"""
+        self.timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
         
     def watch_code_changes(self):
         """Monitor Cursor for business-relevant code changes"""
@@ -76,7 +90,7 @@ class CursorBusinessSync:
                     return
                     
                 # Only process relevant file types
-                if any(event.src_path.endswith(ext) for ext in ['.py', '.js', '.md', '.sh']):
+                if event.src_path.endswith(WATCHED_EXTENSIONS):
                     self.sync.process_code_change(event.src_path)
         
         event_handler = CodeChangeHandler(self)
@@ -85,7 +99,6 @@ class CursorBusinessSync:
         observer.start()
         
         try:
-            import time
             while True:
                 time.sleep(1)
         except KeyboardInterrupt:
@@ -95,6 +108,7 @@ class CursorBusinessSync:
     def process_code_change(self, file_path):
         """Process code changes from Cursor AI"""
         print(f"📝 Processing code change: {file_path}")
+        self.refresh_timestamp()
         
         # Extract business context from file
         context = self.extract_business_context(file_path)
@@ -113,12 +127,8 @@ class CursorBusinessSync:
                 content = f.read()
             
             # Look for business keywords
-            business_keywords = [
-                'hubspot', 'deal', 'pipeline', 'quote', 'revenue',
-                'customer', 'client', 'payment', 'automation'
-            ]
-            
-            found_keywords = [kw for kw in business_keywords if kw.lower() in content.lower()]
+            lowered = content.lower()
+            found_keywords = [kw for kw in BUSINESS_KEYWORDS if kw in lowered]
             
             if found_keywords:
                 return {
@@ -138,7 +148,7 @@ class CursorBusinessSync:
         date_prefix = self.timestamp[:10]
         filename = f"insights/{date_prefix}_cursor-ai-code-insight.md"
         
-        insight_content = f"""# Cursor AI Code Development Insight
+        sections = [f"""# Cursor AI Code Development Insight
 
 ---
 **Created:** {self.timestamp}  
@@ -155,16 +165,16 @@ class CursorBusinessSync:
 - **Timestamp:** {self.timestamp}
 
 ## Business Impact Analysis
-"""
+"""]
         
         # Add specific analysis based on keywords
         if 'hubspot' in context['keywords']:
-            insight_content += "\n### HubSpot Integration\nCode changes related to HubSpot CRM integration. May affect pipeline management or deal processing.\n"
+            sections.append("\n### HubSpot Integration\nCode changes related to HubSpot CRM integration. May affect pipeline management or deal processing.\n")
         
         if 'automation' in context['keywords']:
-            insight_content += "\n### Automation Enhancement\nCode changes related to business process automation. Could impact operational efficiency.\n"
+            sections.append("\n### Automation Enhancement\nCode changes related to business process automation. Could impact operational efficiency.\n")
         
-        insight_content += f"""
+        sections.append(f"""
 ## Recommended Actions
 - [ ] Test code changes with live HubSpot data
 - [ ] Update business process documentation
@@ -178,15 +188,15 @@ class CursorBusinessSync:
 
 ---
 **Generated by:** Cursor AI Integration  
-**Next Review:** {datetime.fromisoformat(self.timestamp[:-1]).strftime('%Y-%m-%d')}
-"""
+**Next Review:** {date_prefix}
+""")
         
         # Write insight file
         insight_path = self.repo_path / filename
         insight_path.parent.mkdir(exist_ok=True)
         
         with open(insight_path, 'w') as f:
-            f.write(insight_content)
+            f.write("".join(sections))
         
         print(f"✅ Created code insight: {filename}")
     
@@ -101,9 +101,12 @@ Sends SMS, retrieves call logs, manages contacts
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
 class OpenPhoneAPI:
     def __init__(self, api_key):
@@ -113,6 +116,22 @@ class OpenPhoneAPI:
             'Authorization': f'Bearer {api_key}',
             'Content-Type': 'application/json'
         }
+        # (connect, read) timeouts so a stalled API call can't hang the sync
+        self.timeout = (3.05, 10)
+        # Reuse one keep-alive connection across API calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Back off and retry transient failures. POST (send_sms) is only
+        # retried on connect errors, where the request was never sent.
+        # Retry-After is ignored so a large value can't stall the sync.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+            respect_retry_after_header=False
+        )
+        self.session.mount('https://', HTTPAdapter(max_retries=retry))
     
     def send_sms(self, to_number, message, from_number=None):
         """Send SMS via OpenPhone"""
@@ -123,26 +142,26 @@ class OpenPhoneAPI:
         if from_number:
             data['from'] = from_number
             
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/messages",
-            headers=self.headers,
-            json=data
+            json=data,
+            timeout=self.timeout
         )
         return response.json()
     
     def get_call_logs(self, limit=50):
         """Retrieve recent call logs"""
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/calls?limit={limit}",
-            headers=self.headers
+            timeout=self.timeout
         )
         return response.json()
     
     def get_messages(self, limit=50):
         """Retrieve recent messages"""
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/messages?limit={limit}",
-            headers=self.headers
+            timeout=self.timeout
         )
         return response.json()
 
@@ -153,7 +172,7 @@ def sync_with_hubspot(phone_data):
 
 def sync_with_knowledge_repo(phone_data):
     """Log phone activity to business knowledge repo"""
-    timestamp = datetime.utcnow().isoformat() + 'Z'
+    timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
     
     log_entry = {
         'timestamp': timestamp,
@@ -163,12 +182,15 @@ def sync_with_knowledge_repo(phone_data):
     
     # Write to knowledge repo
     filename = f"insights/{timestamp[:10]}_openphone-activity.md"
+    content = (
+        f"# OpenPhone Activity Log\n\n"
+        f"**Timestamp:** {timestamp}\n"
+        f"**Source:** OpenPhone API\n\n"
+        f"## Activity Data\n"
+        f"```json\n{json.dumps(phone_data, indent=2)}\n```\n"
+    )
     with open(filename, 'w') as f:
-        f.write(f"# OpenPhone Activity Log\n\n")
-        f.write(f"**Timestamp:** {timestamp}\n")
-        f.write(f"**Source:** OpenPhone API\n\n")
-        f.write(f"## Activity Data\n")
-        f.write(f"```json\n{json.dumps(phone_data, indent=2)}\n```\n")
+        f.write(content)
 
 if __name__ == "__main__":
     # Example usage
@@ -176,9 +198,12 @@ if __name__ == "__main__":
     if api_key:
         openphone = OpenPhoneAPI(api_key)
         
-        # Get recent activity
-        calls = openphone.get_call_logs()
-        messages = openphone.get_messages()
+        # Get recent activity (both requests in flight at once)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            calls_future = executor.submit(openphone.get_call_logs)
+            messages_future = executor.submit(openphone.get_messages)
+            calls = calls_future.result()
+            messages = messages_future.result()
         
         # Sync with systems
         sync_with_hubspot(calls)
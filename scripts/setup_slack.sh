@@ -133,11 +133,21 @@ from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 import os
 import json
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
 
 # Initialize Slack app
 app = App(token=os.environ.get("SLACK_BOT_TOKEN"))
 
+# Keywords that mark a Slack message as business-relevant
+BUSINESS_KEYWORDS = (
+    'deal', 'client', 'quote', 'revenue', 'payment',
+    'contract', 'proposal', 'meeting', 'follow up'
+)
+
+# Bolt runs listeners on a thread pool; serialise appends to the daily file
+_intel_file_lock = threading.Lock()
+
 @app.command("/pipeline")
 def pipeline_command(ack, respond, command):
     """Show HubSpot pipeline status"""
@@ -202,15 +212,12 @@ def handle_message_events(body, logger):
 
 def should_capture_slack_message(text):
     """Check if message should be captured for business intelligence"""
-    business_keywords = [
-        'deal', 'client', 'quote', 'revenue', 'payment',
-        'contract', 'proposal', 'meeting', 'follow up'
-    ]
-    return any(keyword in text.lower() for keyword in business_keywords)
+    lowered = text.lower()
+    return any(keyword in lowered for keyword in BUSINESS_KEYWORDS)
 
 def save_business_message(event):
     """Save business message to knowledge repo"""
-    timestamp = datetime.utcnow().isoformat() + 'Z'
+    timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
     
     message_data = {
         'timestamp': timestamp,
@@ -221,15 +228,21 @@ def save_business_message(event):
         'type': 'business_communication'
     }
     
-    # Save to file
+    # Append to the daily file instead of rewriting it per message
     filename = f"insights/{timestamp[:10]}_slack-business-intel.md"
-    with open(filename, 'w') as f:
-        f.write(f"# Slack Business Intelligence\n\n")
-        f.write(f"**Timestamp:** {timestamp}\n")
-        f.write(f"**Channel:** {event.get('channel')}\n")
-        f.write(f"**User:** {event.get('user')}\n\n")
-        f.write(f"## Message Content\n")
-        f.write(f"{event.get('text')}\n\n")
+    entry = (
+        f"## Message {timestamp}\n"
+        f"**Timestamp:** {timestamp}\n"
+        f"**Channel:** {event.get('channel')}\n"
+        f"**User:** {event.get('user')}\n\n"
+        f"### Message Content\n"
+        f"{event.get('text')}\n\n"
+    )
+    with _intel_file_lock, open(filename, 'a') as f:
+        # Append mode starts at end of file, so 0 means a new daily file
+        if f.tell() == 0:
+            entry = "# Slack Business Intelligence\n\n" + entry
+        f.write(entry)
 
 def get_pipeline_summary():
     """Get pipeline summary from HubSpot analysis"""